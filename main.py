@@ -3,18 +3,19 @@
 def main():
     """Main function."""
     # Imports
-    import json
     from src.tree_scaper.config_manager import ConfigManager
-    from src.tree_scaper.tree_visualizer import TreeVisualizer
     from src.tree_scaper.constants import DATA_PATH
+    from src.tree_scaper.utils import load_json
 
     # Load main configuration file
     config_manager = ConfigManager()
     config = config_manager.load_config_file()
 
     # Load data.
-    with open(DATA_PATH, "r", encoding="utf-8") as file:
-        tree_data = json.load(file)
+    tree_data = load_json(DATA_PATH)
+
+    # Imported only now so pygame is not loaded when config or data fail.
+    from src.tree_scaper.tree_visualizer import TreeVisualizer
 
     # Initialize TreeVisualization class.
     tree_visualizer = TreeVisualizer(tree_data, config)
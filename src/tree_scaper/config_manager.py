@@ -1,17 +1,48 @@
 """Module for loading the configuration files."""
 
+import os
 import yaml
+import pickle
+import hashlib
+import pydantic
+import functools
+import contextlib
+import logging
+import tempfile
 
 from pathlib import Path
-from pydantic import BaseModel, confloat, ConfigDict
+from pydantic import BaseModel, ConfigDict, model_validator
 
-from src.tree_scaper.constants import CONFIG_PATH
+from src.tree_scaper.constants import CONFIG_PATH, CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+Color = tuple[int, int, int]
+"""RGB color, validated into a tuple so pygame can use it without conversion."""
+
+CacheHeader = tuple[int, int, int, str]
+"""Identifies the configuration file, module and pydantic version of a cache."""
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+    logger.warning(
+        "PyYAML was built without libyaml; falling back to the slower "
+        "pure-Python SafeLoader."
+    )
 
 
 class ConfiguredBaseModel(BaseModel):
-    """Base model with strict configuration validation enabled."""
+    """
+    Base model with strict configuration validation enabled.
 
-    model_config = ConfigDict(extra="forbid")
+    Models are frozen, so the memoized configuration can safely be shared by
+    every caller of ConfigManager.load_config_file.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class ConfigModel(ConfiguredBaseModel):
@@ -32,6 +63,12 @@ class ConfigModel(ConfiguredBaseModel):
         dark_mode: bool
         """Whether to display the tree visualization in dark mode."""
 
+        export_measured_tree: bool = False
+        """
+        Whether to write the measured tree to a '_export' JSON file next to
+        the data file before the visualization starts. Defaults to False.
+        """
+
     class Window(ConfiguredBaseModel):
         """Window configuration for the visualization canvas."""
 
@@ -48,6 +85,13 @@ class ConfigModel(ConfiguredBaseModel):
         min_size: int
         name: str
 
+        antialias: bool = True
+        """
+        Render text with antialiasing. Disabling it makes rendering text
+        cheaper, mostly noticeable at small font sizes, but gives jagged text.
+        Defaults to True.
+        """
+
     class Zoom(ConfiguredBaseModel):
         """Parameters related to zooming."""
 
@@ -66,8 +110,16 @@ class ConfigModel(ConfiguredBaseModel):
     class RootNodePosition(ConfiguredBaseModel):
         """Defining root node position."""
 
-        x: confloat(ge=0, le=1)  # type: ignore
-        y: confloat(ge=0, le=1)  # type: ignore
+        x: float
+        y: float
+
+        @model_validator(mode="after")
+        def _check_ratios(self) -> "ConfigModel.RootNodePosition":
+            """Ensure both coordinates are ratios between 0 and 1."""
+            if not (0 <= self.x <= 1 and 0 <= self.y <= 1):
+                raise ValueError("root node position x and y must lie in [0, 1]")
+
+            return self
 
     class Layout(ConfiguredBaseModel):
         """Layout configuration for tree spacing."""
@@ -78,9 +130,9 @@ class ConfigModel(ConfiguredBaseModel):
     class Colors(ConfiguredBaseModel):
         """Basic color definitions used throughout the visualization."""
 
-        white: list[int]
-        gray: list[int]
-        black: list[int]
+        white: Color
+        gray: Color
+        black: Color
 
     class ColorPalettes(ConfiguredBaseModel):
         """ """
@@ -88,21 +140,21 @@ class ConfigModel(ConfiguredBaseModel):
         class LightPalettes(ConfiguredBaseModel):
             """ """
 
-            green: list[list[int]]
-            red: list[list[int]]
-            blue: list[list[int]]
-            purple: list[list[int]]
-            teal: list[list[int]]
-            orange: list[list[int]]
-            brown: list[list[int]]
-            slate: list[list[int]]
+            green: list[Color]
+            red: list[Color]
+            blue: list[Color]
+            purple: list[Color]
+            teal: list[Color]
+            orange: list[Color]
+            brown: list[Color]
+            slate: list[Color]
 
         class DarkPalettes(ConfiguredBaseModel):
             """ """
 
-            yellow: list[list[int]]
-            amber: list[list[int]]
-            olive: list[list[int]]
+            yellow: list[Color]
+            amber: list[Color]
+            olive: list[Color]
 
         light: LightPalettes
         dark: DarkPalettes
@@ -127,14 +179,18 @@ class ConfigManager:
     be used throughout the application.
     """
 
-    def __init__(self, config_path: Path = CONFIG_PATH):
+    def __init__(self, config_path: Path = CONFIG_PATH, cache_dir: Path = CACHE_DIR):
         """
         Initialize the ConfigManager with a configuration file path.
 
         Args:
             config_path (Path): Path to the configuration YAML file.
+            cache_dir (Path): Directory in which the validated configuration
+                is cached between runs.
         """
         self.config_path = config_path
+        path_hash = hashlib.sha1(str(config_path.resolve()).encode()).hexdigest()
+        self.cache_path = cache_dir / f"{path_hash}.pkl"
 
     def load_config_file(self) -> ConfigModel:
         """
@@ -144,10 +200,128 @@ class ConfigManager:
         contents into a dictionary, and instantiates a ConfigModel from it.
         Validation is handled implicitly by the ConfigModel constructor.
 
+        The validated model is pickled to the cache directory together with
+        the modification time and size of the configuration file, the
+        modification time of this module and the installed pydantic version.
+        As long as none of these change, subsequent runs load the pickle
+        instead of parsing and validating the YAML again.
+
         Returns:
             ConfigModel: Parsed and validated configuration object.
         """
-        with open(self.config_path) as file:
-            config = yaml.safe_load(file)
+        file_stat = self.config_path.stat()
+        # The modification time of this module and the pydantic version are
+        # part of the header, so a schema change or a pydantic upgrade
+        # invalidates models pickled by an older version.
+        cache_header = (
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+            Path(__file__).stat().st_mtime_ns,
+            pydantic.VERSION,
+        )
+
+        return _load_config(self.config_path, self.cache_path, cache_header)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config(
+    config_path: Path, cache_path: Path, cache_header: CacheHeader
+) -> ConfigModel:
+    """
+    Load the configuration from the pickle cache or by parsing the YAML file.
+
+    The result is memoized per (path, header), so repeated loads of an
+    unchanged file within one process return the same ConfigModel instance.
+
+    Args:
+        config_path (Path): Path to the configuration YAML file.
+        cache_path (Path): Path of the pickle cache for this file.
+        cache_header (CacheHeader): Header identifying the current version
+            of the configuration file.
+
+    Returns:
+        ConfigModel: Parsed and validated configuration object.
+    """
+    config_model = _read_cache(cache_path, cache_header)
+
+    if config_model is not None:
+        return config_model
+
+    config = yaml.load(config_path.read_bytes(), Loader=SafeLoader)
+
+    config_model = ConfigModel(**config)
+    _write_cache(cache_path, cache_header, config_model)
+
+    return config_model
+
 
-        return ConfigModel(**config)
+def _read_cache(cache_path: Path, cache_header: CacheHeader) -> ConfigModel | None:
+    """
+    Load a previously cached ConfigModel if it matches the given header.
+
+    The header is stored as a separate pickle record in front of the model,
+    so the model is only unpickled when the header matches, i.e. when it was
+    pickled by the same module and pydantic version.
+
+    Args:
+        cache_path (Path): Path of the pickle cache.
+        cache_header (CacheHeader): Modification time and size of the
+            configuration file, modification time of this module and the
+            pydantic version.
+
+    Returns:
+        ConfigModel | None: The cached model, or None on a cache miss.
+    """
+    try:
+        with open(cache_path, "rb") as file:
+            if pickle.load(file) != cache_header:
+                return None
+
+            config_model = pickle.load(file)
+    except Exception:
+        # A missing, corrupt or incompatible cache is treated as a miss;
+        # unpickling bad data can raise almost any exception.
+        return None
+
+    if not isinstance(config_model, ConfigModel):
+        return None
+
+    return config_model
+
+
+def _write_cache(
+    cache_path: Path, cache_header: CacheHeader, config_model: ConfigModel
+) -> None:
+    """
+    Atomically write the validated ConfigModel to the cache directory.
+
+    The header and the model are written as two consecutive pickle records
+    (see _read_cache).
+
+    Failing to write the cache (e.g. on a read-only file system) is not an
+    error; the configuration is then simply parsed again on the next run. A
+    partially written temporary file is removed.
+
+    Args:
+        cache_path (Path): Path of the pickle cache.
+        cache_header (CacheHeader): Header identifying the parsed
+            configuration file.
+        config_model (ConfigModel): The validated configuration object.
+    """
+    temp_path = None
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=cache_path.parent, delete=False
+        ) as file:
+            temp_path = Path(file.name)
+            pickle.dump(cache_header, file, protocol=5)
+            pickle.dump(config_model, file, protocol=5)
+
+        os.replace(temp_path, cache_path)
+    except (OSError, pickle.PicklingError):
+        if temp_path is not None:
+            with contextlib.suppress(OSError):
+                temp_path.unlink(missing_ok=True)
@@ -1,9 +1,26 @@
 """Module for storing project constants."""
 
+import os
+
 from pathlib import Path
 from collections import namedtuple
 
 Position = namedtuple("Position", "x y")
+LayoutParams = namedtuple(
+    "LayoutParams",
+    "horizontal_spacing vertical_spacing margin_x margin_y border_thickness",
+)
 
 CONFIG_PATH = Path("src/tree_scaper/configs/config.yaml")
 DATA_PATH = Path("src/tree_scaper/data/example_data.json")
+
+# Per the XDG base directory specification, a relative XDG_CACHE_HOME is
+# ignored in favour of the default ~/.cache.
+_XDG_CACHE_HOME = Path(os.environ.get("XDG_CACHE_HOME", ""))
+CACHE_DIR = (
+    _XDG_CACHE_HOME if _XDG_CACHE_HOME.is_absolute() else Path.home() / ".cache"
+) / "tree_scaper"
+
+# Maximum size in pixels of the off-screen canvas holding the whole drawn tree
+# (64 MB at 32 bits per pixel). Larger trees are drawn per scroll instead.
+TREE_CANVAS_MAX_PIXELS = 4096 * 4096
@@ -0,0 +1,99 @@
+"""Module defining the measured representation of tree nodes."""
+
+from dataclasses import dataclass, field
+
+from src.tree_scaper.constants import Position
+
+
+@dataclass(slots=True)
+class MeasuredNode:
+    """
+    A tree node together with its layout measurements.
+
+    Measured nodes are produced by the measurement phase of the
+    TreeVisualizer, after which the positioning phase fills in their
+    positions. Using slots instead of a per-node '_measured' dictionary keeps
+    the nodes small and their fields fast to access.
+    """
+
+    title: str
+    subtitle: str
+    title_lines: list[str]
+    subtitle_lines: list[str]
+    width: int
+    height: int
+    top_height: int
+    bottom_height: int
+    subtree_width: int
+    subtree_height: int
+    leaves_only: bool
+    branches: list["MeasuredNode"] = field(default_factory=list)
+    position: Position | None = None
+
+    def walk(self) -> list[tuple["MeasuredNode", int]]:
+        """
+        List this node and all of its descendants in depth-first pre-order.
+
+        Like TreeVisualizer._walk_tree, the traversal uses an explicit stack,
+        so deep trees do not run into the interpreter's recursion limit.
+
+        Returns:
+            list[tuple[MeasuredNode, int]]: (node, level) pairs, where this
+                node is level 0.
+        """
+        nodes = []
+        stack = [(self, 0)]
+
+        while stack:
+            node, level = stack.pop()
+            nodes.append((node, level))
+            stack.extend((branch, level + 1) for branch in reversed(node.branches))
+
+        return nodes
+
+    def to_dict(self) -> dict:
+        """
+        Convert the measured tree rooted at this node into plain dictionaries.
+
+        Every node becomes a dictionary with its 'title' and 'subtitle', a
+        '_measured' dictionary with the layout data, and its converted
+        'branches', so the result can be exported as JSON.
+
+        Returns:
+            dict: The measured tree as nested dictionaries.
+        """
+        tree = self._node_dict()
+        stack = [(self, tree)]
+
+        while stack:
+            node, node_dict = stack.pop()
+
+            for branch in node.branches:
+                branch_dict = branch._node_dict()
+                node_dict["branches"].append(branch_dict)
+                stack.append((branch, branch_dict))
+
+        return tree
+
+    def _node_dict(self) -> dict:
+        """
+        Convert this node, without its branches, into a dictionary.
+
+        Returns:
+            dict: The node's fields, with an empty 'branches' list.
+        """
+        return {
+            "title": self.title,
+            "subtitle": self.subtitle,
+            "_measured": {
+                "width": self.width,
+                "height": self.height,
+                "top_height": self.top_height,
+                "bottom_height": self.bottom_height,
+                "subtree_width": self.subtree_width,
+                "subtree_height": self.subtree_height,
+                "position": self.position,
+                "leaves_only": self.leaves_only,
+            },
+            "branches": [],
+        }
@@ -1,11 +1,42 @@
 """Module for visualizing tree structures using PyGame."""
 
+import functools
 import pygame as pg
-from src.tree_scaper.constants import Position, DATA_PATH
-from src.tree_scaper.config_manager import ConfigModel
+from collections import namedtuple
+from src.tree_scaper.constants import (
+    Position,
+    DATA_PATH,
+    TREE_CANVAS_MAX_PIXELS,
+    LayoutParams,
+)
+from src.tree_scaper.config_manager import Color, ConfigModel
+from src.tree_scaper.measured_node import MeasuredNode
 from src.tree_scaper.utils import export_dict_to_json
 
 
+@functools.lru_cache(maxsize=16)
+def _get_font(name: str, size: int) -> pg.font.Font:
+    """
+    Return the system font with the given name and size.
+
+    SysFont searches the system font database on every call, so fonts are
+    cached; zooming back to a previous level then reuses its font.
+
+    Args:
+        name (str): Name of the system font.
+        size (int): Font size in points.
+
+    Returns:
+        pg.font.Font: The loaded font.
+    """
+    return pg.font.SysFont(name, size)
+
+
+PrebakedNode = namedtuple(
+    "PrebakedNode", "color rect bounds template text_blits connector_path"
+)
+
+
 class TreeVisualizer:
     """Visualizes hierarchical tree structures using PyGame."""
 
@@ -28,13 +59,15 @@ class TreeVisualizer:
 
         # Data
         self.tree = tree_data
-        self.measured_tree: dict
+        self.measured_tree: MeasuredNode
+        self.render_list: list[PrebakedNode] = []
         self.max_depth: int = self._get_max_depth(self.tree)
 
         # Runtime / behavior
         self.v_stack_leafs = self.config.runtime.v_stack_leafs
         self.align_v_stack = self.config.runtime.align_v_stack
         self.dark_mode = self.config.runtime.dark_mode
+        self.export_measured_tree = self.config.runtime.export_measured_tree
 
         # Window
         self.window_name = self.config.window.name
@@ -48,6 +81,7 @@ class TreeVisualizer:
         self.font_size = self.config.font.size
         self.min_font_size = self.config.font.min_size
         self.font_name = self.config.font.name
+        self.font_antialias = self.config.font.antialias
 
         # Zoom
         self.zoom = self.config.zoom.start_level
@@ -58,10 +92,8 @@ class TreeVisualizer:
         self.zoom_factor = self.config.zoom.zoom_factor
         self.base_font_size = self.font_size
 
-        # Node
-        self.border_thickness = self.config.node_size.border_thickness
-        self.node_margin_x = self.config.node_size.margin_x
-        self.node_margin_y = self.config.node_size.margin_y
+        # Node and layout sizes, scaled to the zoom level
+        self.layout_params: LayoutParams
 
         # Root node position
         self.root_node_position = Position(
@@ -69,15 +101,12 @@ class TreeVisualizer:
             y=self.config.root_node_position.y * self.window_height,
         )
 
-        # Layout
-        self.horizontal_spacing = self.config.layout.horizontal_spacing
-        self.vertical_spacing = self.config.layout.vertical_spacing
-
         # Colors
-        self.text_color: list[int]
-        self.background_color: list[int]
-        self.leaf_background_color: list[int]
-        self.color_levels: list[list[int]]
+        self.text_color: Color
+        self.background_color: Color
+        self.leaf_background_color: Color
+        self.color_levels: list[Color]
+        self.level_node_colors: list[Color]
         self._set_colors()
 
         # File export
@@ -88,37 +117,90 @@ class TreeVisualizer:
         # Initialize PyGame
         pg.init()
 
-        # Create and set fonts.
-        self.font_top: pg.font.Font
-        self.font_bottom: pg.font.Font
+        # Create and set the font.
+        self.font: pg.font.Font
+        self._size_cache: dict[tuple[int, str], tuple[int, int]] = {}
+        self._surface_cache: dict[tuple[str, Color], pg.Surface] = {}
+        self._node_templates: dict[tuple[int, int, int, Color], pg.Surface] = {}
         self._recompute_zoom_dependent_state()
 
         # Initialize window
         self.screen = self._init_pg_window()
 
-    def _get_max_depth(self, node: dict, level: int = 0) -> int:
+        # Whether the screen shows the current view.
+        self._scene_valid = False
+
+        # Off-screen surface holding the whole drawn tree, and its position
+        # without scroll offset. It is only built once the view is scrolled
+        # after a layout change, and never if the tree is too large for it.
+        self._tree_canvas: pg.Surface | None = None
+        self._tree_canvas_origin = (0, 0)
+        self._tree_canvas_too_large = False
+        self._scrolled_since_layout = False
+
+        # Whether the window content has to be updated on the next frame.
+        self._dirty = True
+
+        # Event handlers by event type. Events of other types are ignored.
+        self._event_handlers = {
+            pg.QUIT: self._on_quit,
+            pg.VIDEOEXPOSE: self._on_expose,
+            pg.WINDOWEXPOSED: self._on_expose,
+            pg.WINDOWFOCUSGAINED: self._on_expose,
+            pg.MOUSEWHEEL: self._on_mouse_wheel,
+        }
+
+    def _walk_tree(self, tree: dict) -> list[tuple[dict, int]]:
         """
-        Recursively compute the maximum depth of a tree.
+        List all nodes of a tree in depth-first pre-order, with their level.
 
-        The root node is considered level 0. Each recursive descent into
-        a child branch increases the level by 1.
+        The traversal uses an explicit stack instead of recursion, so deep
+        trees do not run into the interpreter's recursion limit. Branches are
+        visited in their original order. Iterating the result in reverse
+        yields every node after all of its descendants (bottom-up order).
 
         Args:
-            node (dict): Current node in the tree.
-            level (int): Current depth level.
+            tree (dict): Root node of a tree with optional 'branches' lists.
 
         Returns:
-            int: Maximum depth found in this subtree.
+            list[tuple[dict, int]]: (node, level) pairs, where the root node
+                is level 0.
         """
-        branches = node.get("branches", [])
+        nodes = []
+        stack = [(tree, 0)]
+
+        while stack:
+            node, level = stack.pop()
+            nodes.append((node, level))
+            stack.extend(
+                (branch, level + 1) for branch in reversed(node.get("branches", []))
+            )
 
-        if not branches:
-            return level
+        return nodes
+
+    def _get_max_depth(self, tree: dict) -> int:
+        """
+        Compute the maximum depth of a tree.
 
-        return max(self._get_max_depth(child, level + 1) for child in branches)
+        The root node is considered level 0. Each descent into a child branch
+        increases the level by 1.
+
+        Args:
+            tree (dict): Root node of the tree.
+
+        Returns:
+            int: Maximum depth found in the tree.
+        """
+        return max(level for _, level in self._walk_tree(tree))
 
     def _set_colors(self) -> None:
-        """ """
+        """
+        Set the colors for the current color mode.
+
+        Also builds self.level_node_colors, which maps every tree level to its
+        node color: the deepest level uses the leaf color, and levels beyond
+        the palette reuse its last color.
+        """
         if not self.dark_mode:
             self.text_color = self.config.colors.black
             self.background_color = self.config.colors.white
@@ -130,22 +212,32 @@ class TreeVisualizer:
             self.leaf_background_color = self.config.colors.gray
             self.color_levels = self.config.color_palettes.dark.yellow
 
+        self.level_node_colors = [
+            self.color_levels[min(level, len(self.color_levels) - 1)]
+            for level in range(self.max_depth)
+        ]
+        self.level_node_colors.append(self.leaf_background_color)
+
     def _recompute_zoom_dependent_state(self) -> None:
         """Update zoom-dependent parameters like fonts and node metrics."""
         scaled_size = max(self.min_font_size, int(self.base_font_size * self.zoom))
-        self.font_top = pg.font.SysFont(self.font_name, scaled_size)
-        self.font_bottom = pg.font.SysFont(self.font_name, scaled_size)
-
-        self.node_margin_x = max(1, int(self.config.node_size.margin_x * self.zoom))
-        self.node_margin_y = max(1, int(self.config.node_size.margin_y * self.zoom))
-        self.horizontal_spacing = max(
-            1, int(self.config.layout.horizontal_spacing * self.zoom)
-        )
-        self.vertical_spacing = max(
-            1, int(self.config.layout.vertical_spacing * self.zoom)
-        )
-        self.border_thickness = max(
-            1, int(self.config.node_size.border_thickness * self.zoom)
+        self.font = _get_font(self.font_name, scaled_size)
+        self._size_cache.clear()
+        self._surface_cache.clear()
+        self._node_templates.clear()
+
+        self.layout_params = LayoutParams(
+            horizontal_spacing=max(
+                1, int(self.config.layout.horizontal_spacing * self.zoom)
+            ),
+            vertical_spacing=max(
+                1, int(self.config.layout.vertical_spacing * self.zoom)
+            ),
+            margin_x=max(1, int(self.config.node_size.margin_x * self.zoom)),
+            margin_y=max(1, int(self.config.node_size.margin_y * self.zoom)),
+            border_thickness=max(
+                1, int(self.config.node_size.border_thickness * self.zoom)
+            ),
         )
 
     def _init_pg_window(self) -> pg.Surface:
@@ -161,13 +253,17 @@ class TreeVisualizer:
         return screen
 
     def _update_tree_layout(self) -> None:
-        """Measure, align, and assign positions for the current tree."""
+        """Measure, assign positions, and prebake the current tree."""
         self.measured_tree = self._measure_tree(self.tree)
+        self._assign_positions(self.measured_tree, self.root_node_position)
 
-        if self.v_stack_leafs and self.align_v_stack:
-            self._apply_vstack_alignment(self.measured_tree)
+        self.render_list = []
+        self._prebake_tree(self.measured_tree)
 
-        self._assign_positions(self.measured_tree, self.root_node_position)
+        self._tree_canvas = None
+        self._tree_canvas_too_large = False
+        self._scrolled_since_layout = False
+        self._invalidate_scene()
 
     def _set_zoom(self, new_zoom: float) -> None:
         """Clamp zoom, update fonts, and update tree layout."""
@@ -180,245 +276,295 @@ class TreeVisualizer:
         self._recompute_zoom_dependent_state()
         self._update_tree_layout()
 
-    def _handle_events(self) -> None:
+    def _handle_events(self, wait: bool = False) -> None:
         """
-        Handles pygame events, including quitting the application.
+        Handles pygame events by dispatching them to their event handlers.
+
+        Events whose type has no entry in self._event_handlers are skipped.
+
+        Args:
+            wait (bool): If no events are pending, block until the next event
+                arrives instead of returning immediately.
         """
+        events = pg.event.get()
+
+        if wait and not events:
+            events = [pg.event.wait()]
+
+        handlers = self._event_handlers
 
-        for event in pg.event.get():
-            if event.type == pg.QUIT:
-                pg.quit()
-                raise SystemExit
-            elif event.type == pg.MOUSEWHEEL:
-                mods = pg.key.get_mods()
+        for event in events:
+            handler = handlers.get(event.type)
 
-                # Zooming in and out.
-                if mods & pg.KMOD_CTRL:
-                    factor = self.zoom_factor**event.y
-                    self._set_zoom(self.zoom * factor)
+            if handler is not None:
+                handler(event)
 
-                # Horizontal scrolling.
-                elif mods & pg.KMOD_SHIFT:
-                    self.scroll_x += event.y * self.scroll_speed_horizontal
+    def _on_quit(self, event: pg.event.Event) -> None:
+        """Quit the application."""
+        pg.quit()
+        raise SystemExit
 
-                # Vertical scrolling.
-                else:
-                    self.scroll_y += event.y * self.scroll_speed_vertical
+    def _on_expose(self, event: pg.event.Event) -> None:
+        """
+        Mark the display as dirty.
 
-    def _measure_node(self, node_data: dict) -> tuple[int, int, int, int]:
+        Used for events that require the window content to be shown again,
+        such as the window being exposed or regaining focus.
+        """
+        self._dirty = True
+
+    def _on_mouse_wheel(self, event: pg.event.Event) -> None:
+        """Zoom with ctrl held, scroll horizontally with shift, else vertically."""
+        mods = pg.key.get_mods()
+
+        # Zooming in and out.
+        if mods & pg.KMOD_CTRL:
+            factor = self.zoom_factor**event.y
+            self._set_zoom(self.zoom * factor)
+
+        # Horizontal scrolling.
+        elif mods & pg.KMOD_SHIFT:
+            self.scroll_x += event.y * self.scroll_speed_horizontal
+            self._scrolled_since_layout = True
+            self._invalidate_scene()
+
+        # Vertical scrolling.
+        else:
+            self.scroll_y += event.y * self.scroll_speed_vertical
+            self._scrolled_since_layout = True
+            self._invalidate_scene()
+
+    def _line_size(self, font: pg.font.Font, line: str) -> tuple[int, int]:
+        """
+        Return the pixel size of a single line of text, memoized per font.
+
+        Uses Font.size, which computes the text metrics without rasterizing
+        the glyphs. Results are cached in self._size_cache, which is cleared
+        whenever the font changes.
+
+        Args:
+            font (pg.font.Font): Font used to render the line.
+            line (str): A single line of text.
+
+        Returns:
+            tuple[int, int]: The (width, height) of the rendered line.
+        """
+        key = (id(font), line)
+        size = self._size_cache.get(key)
+
+        if size is None:
+            size = self._size_cache[key] = font.size(line)
+
+        return size
+
+    def _render_line(self, line: str, color: Color) -> pg.Surface:
+        """
+        Return the rendered surface for a single line of text in the current
+        font.
+
+        The line is antialiased unless font.antialias is disabled in the
+        configuration.
+
+        Lines that occur more than once in the tree (e.g. repeated titles) are
+        rendered once per layout: surfaces are cached in self._surface_cache,
+        which is cleared together with the other zoom-dependent state.
+
+        Args:
+            line (str): A single line of text.
+            color (Color): Text color.
+
+        Returns:
+            pg.Surface: The rendered text surface.
+        """
+        key = (line, color)
+        surf = self._surface_cache.get(key)
+
+        if surf is None:
+            surf = self._surface_cache[key] = self.font.render(
+                line, self.font_antialias, color
+            )
+
+        return surf
+
+    def _measure_node(
+        self, title_lines: list[str], subtitle_lines: list[str]
+    ) -> tuple[int, int, int, int]:
         """
         Compute the pixel size required to render a single node.
 
         This method measures how much space a node needs based on its textual
         content and layout configuration. The process is as follows:
 
-        1. Split the node's title and subtitle into separate text lines.
-        2. Render each line using the configured pygame fonts.
-        3. Measure the width of every rendered text surface.
-        4. Determine the node width as the maximum text width plus horizontal
+        1. Measure the size of each title and subtitle line using the
+           configured pygame font, without rendering it (see _line_size).
+        2. Determine the node width as the maximum text width plus horizontal
            padding, while enforcing a minimum node width.
-        5. Compute the height of the title and subtitle sections separately by
+        3. Compute the height of the title and subtitle sections separately by
            summing their text heights and adding vertical padding.
-        6. Combine the title and subtitle heights into the final node height.
+        4. Combine the title and subtitle heights into the final node height.
 
         Args:
-            node_data (dict): A node dictionary containing 'title' and
-                'subtitle' text fields.
+            title_lines (list[str]): The node's title, split into lines.
+            subtitle_lines (list[str]): The node's subtitle, split into lines.
 
         Returns:
             tuple[int, int, int, int]: The computed (width, height) of the node in pixels.
         """
-        title_lines = node_data["title"].split("\n")
-        subtitle_lines = node_data["subtitle"].split("\n")
-        dummy_color_value = (0, 0, 0)
+        params = self.layout_params
 
-        top_surfs = [
-            self.font_top.render(line, True, dummy_color_value) for line in title_lines
-        ]
+        top_sizes = [self._line_size(self.font, line) for line in title_lines]
+        bottom_sizes = [self._line_size(self.font, line) for line in subtitle_lines]
 
-        bottom_surfs = [
-            self.font_bottom.render(line, True, dummy_color_value)
-            for line in subtitle_lines
-        ]
-
-        text_widths = [surf.get_width() for surf in top_surfs + bottom_surfs]
-        width = max(text_widths) + self.node_margin_x * 2
+        text_widths = [line_width for line_width, _ in top_sizes + bottom_sizes]
+        width = max(text_widths) + params.margin_x * 2
 
         top_height = (
-            sum(surf.get_height() for surf in top_surfs) + self.node_margin_y * 2
+            sum(line_height for _, line_height in top_sizes) + params.margin_y * 2
         )
 
         bottom_height = (
-            sum(surf.get_height() for surf in bottom_surfs) + self.node_margin_y * 2
+            sum(line_height for _, line_height in bottom_sizes) + params.margin_y * 2
         )
 
         height = top_height + bottom_height
 
         return width, height, top_height, bottom_height
 
-    def _measure_tree(self, node_data: dict) -> dict:
+    def _measure_tree(self, node_data: dict) -> MeasuredNode:
         """
-        Recursively measure a tree and compute layout metadata.
+        Measure a tree and compute layout metadata.
+
+        This method visits the nodes bottom-up, so every branch is measured
+        before its parent, and constructs a new tree containing layout
+        measurements for every node (see _measure_subtree).
+
+        Args:
+            node_data (dict): A node dictionary that may contain a 'branches'
+                list of child nodes.
+
+        Returns:
+            MeasuredNode: The root of a new tree of measured nodes.
+        """
+        measured_nodes: dict[int, MeasuredNode] = {}
+
+        for node, _ in reversed(self._walk_tree(node_data)):
+            measured_branches = [
+                measured_nodes.pop(id(branch_node))
+                for branch_node in node.get("branches", [])
+            ]
+            measured_nodes[id(node)] = self._measure_subtree(node, measured_branches)
 
-        This method traverses the tree structure depth-first and constructs a
-        new tree containing layout measurements for every node. The process is
-        as follows:
+        return measured_nodes[id(node_data)]
 
-        1. Measure the visual size of the current node using measure_node.
-        2. Recursively call _measure_tree on each branch (child node).
-        3. If the node has branches:
+    def _measure_subtree(
+        self, node_data: dict, measured_branches: list[MeasuredNode]
+    ) -> MeasuredNode:
+        """
+        Measure a single node whose branches have already been measured.
+
+        The process is as follows:
+
+        1. Split the node's title and subtitle into lines, and measure the
+           visual size of the current node from them using measure_node.
+        2. If the node has branches:
            - Sum the subtree widths of all branches.
            - Add horizontal spacing between sibling subtrees.
            - Compute the subtree height as the node height plus vertical
              spacing and the maximum child subtree height.
-        4. If the node has no branches, its subtree size equals its own size.
-        5. Create a new node dictionary that:
-           - Copies the original node data.
-           - Replaces 'branches' with the measured branch nodes.
-           - Attaches a '_measured' dictionary containing size and layout
-             metadata used for positioning and rendering.
+           If the node only has leaf branches and v_stack_leafs is enabled,
+           the branches are stacked vertically instead. With align_v_stack
+           enabled, the node and its leaf stack are also given the same width
+           (the maximum of their widths), by updating the already measured
+           leaf branches.
+        3. If the node has no branches, its subtree size equals its own size.
+        4. Create a MeasuredNode that holds the node's text, including the
+           split title and subtitle lines so they are not split again when
+           the node is prebaked, its size and layout metadata used for
+           positioning and rendering, and the measured branch nodes.
 
         Args:
             node_data (dict): A node dictionary that may contain a 'branches'
                 list of child nodes.
+            measured_branches (list[MeasuredNode]): The measured versions of
+                the node's branches, in their original order.
 
         Returns:
-            dict: A new tree structure augmented with '_measured' layout data
-                for each node.
+            MeasuredNode: The measured node, whose position is not yet set.
         """
+        params = self.layout_params
+
+        title_lines = node_data["title"].split("\n")
+        subtitle_lines = node_data["subtitle"].split("\n")
+
         node_width, node_height, top_height, bottom_height = self._measure_node(
-            node_data
+            title_lines, subtitle_lines
         )
-        branches = node_data.get("branches", [])
-        measured_branches = [
-            self._measure_tree(branch_node) for branch_node in branches
-        ]
 
         # Determine whether this node has only leaf children
         if measured_branches:
             leaves_only = self.v_stack_leafs and all(
-                not child.get("branches") for child in measured_branches
+                not child.branches for child in measured_branches
             )
         else:
             leaves_only = False
 
         if measured_branches and not leaves_only:
             total_width = sum(
-                branch_node["_measured"]["subtree_width"]
-                for branch_node in measured_branches
+                branch_node.subtree_width for branch_node in measured_branches
             )
 
-            total_width += self.horizontal_spacing * (len(measured_branches) - 1)
+            total_width += params.horizontal_spacing * (len(measured_branches) - 1)
             total_width = max(total_width, node_width)
 
             total_height = (
                 node_height
-                + self.vertical_spacing
-                + max(
-                    branch_node["_measured"]["subtree_height"]
-                    for branch_node in measured_branches
-                )
+                + params.vertical_spacing
+                + max(branch_node.subtree_height for branch_node in measured_branches)
             )
         elif measured_branches and leaves_only:
-            max_child_width = max(
-                child["_measured"]["width"] for child in measured_branches
-            )
+            max_child_width = max(child.width for child in measured_branches)
             total_width = max(node_width, max_child_width)
 
+            if self.align_v_stack:
+                node_width = total_width
+
+                for child in measured_branches:
+                    child.width = total_width
+                    child.subtree_width = total_width
+
             children_height = sum(
-                child["_measured"]["height"] for child in measured_branches
-            ) + self.vertical_spacing * (len(measured_branches) - 1)
-            total_height = node_height + self.vertical_spacing + children_height
+                child.height for child in measured_branches
+            ) + params.vertical_spacing * (len(measured_branches) - 1)
+            total_height = node_height + params.vertical_spacing + children_height
         else:
             total_width = node_width
             total_height = node_height
 
-        measured_node = {
-            "title": node_data["title"],
-            "subtitle": node_data["subtitle"],
-            "_measured": {
-                "width": node_width,
-                "height": node_height,
-                "top_height": top_height,
-                "bottom_height": bottom_height,
-                "subtree_width": total_width,
-                "subtree_height": total_height,
-                "position": None,
-                "leaves_only": leaves_only,
-            },
-            "branches": measured_branches,
-        }
-
-        return measured_node
-
-    def _apply_vstack_alignment(self, measured_tree: dict) -> None:
-        """
-        Post-process measured tree to align widths for vertical leaf stacks.
-
-        This walks the measured tree bottom-up. For nodes marked as
-        '_measured.leaves_only', it makes the parent and all direct leaf
-        children share the same width (the maximum of their current widths).
-        It also recomputes subtree_width and subtree_height for each node so
-        ancestor measurements remain correct.
-
-        This method mutates the measured_tree in-place.
-        """
-        for child in measured_tree.get("branches", []):
-            self._apply_vstack_alignment(child)
-
-        branches = measured_tree.get("branches", [])
-
-        if not branches:
-            measured_tree["_measured"]["subtree_width"] = measured_tree["_measured"][
-                "width"
-            ]
-            measured_tree["_measured"]["subtree_height"] = measured_tree["_measured"][
-                "height"
-            ]
-            return
-
-        if measured_tree["_measured"]["leaves_only"] and self.align_v_stack:
-            max_child_width = max(child["_measured"]["width"] for child in branches)
-            target_width = max(measured_tree["_measured"]["width"], max_child_width)
-
-            measured_tree["_measured"]["width"] = target_width
-
-            for child in branches:
-                child["_measured"]["width"] = target_width
-                child["_measured"]["subtree_width"] = target_width
-                child["_measured"]["subtree_height"] = child["_measured"]["height"]
-
-            children_height = sum(
-                child["_measured"]["height"] for child in branches
-            ) + self.vertical_spacing * (len(branches) - 1)
-
-            measured_tree["_measured"]["subtree_width"] = target_width
-            measured_tree["_measured"]["subtree_height"] = (
-                measured_tree["_measured"]["height"]
-                + self.vertical_spacing
-                + children_height
-            )
-        else:
-            total_width = sum(
-                child["_measured"]["subtree_width"] for child in branches
-            ) + self.horizontal_spacing * (len(branches) - 1)
-            measured_tree["_measured"]["subtree_width"] = max(
-                measured_tree["_measured"]["width"], total_width
-            )
-            measured_tree["_measured"]["subtree_height"] = (
-                measured_tree["_measured"]["height"]
-                + self.vertical_spacing
-                + max(child["_measured"]["subtree_height"] for child in branches)
-            )
+        return MeasuredNode(
+            title=node_data["title"],
+            subtitle=node_data["subtitle"],
+            title_lines=title_lines,
+            subtitle_lines=subtitle_lines,
+            width=node_width,
+            height=node_height,
+            top_height=top_height,
+            bottom_height=bottom_height,
+            subtree_width=total_width,
+            subtree_height=total_height,
+            leaves_only=leaves_only,
+            branches=measured_branches,
+        )
 
-    def _assign_positions(self, measured_tree: dict, position: Position) -> None:
+    def _assign_positions(
+        self, measured_tree: MeasuredNode, position: Position
+    ) -> None:
         """
         Assign screen positions to all nodes in a measured tree.
 
-        This method performs a second recursive traversal over the tree after
+        This method performs a second traversal over the tree after
         all size measurements have been completed. It relies on the fact that
-        every node already contains accurate width and height information in
-        its '_measured' metadata.
+        every measured node already contains accurate width and height
+        information.
 
         The separation of measurement and positioning is essential, because
         node positions depend on the total subtree sizes of sibling nodes,
@@ -426,7 +572,10 @@ class TreeVisualizer:
 
         The positioning process works as follows:
 
-        1. Assign the given (x, y) position to the current node.
+        Nodes are processed top-down with an explicit stack. Starting with the
+        root node and the given position, for every node:
+
+        1. Assign its (x, y) position to the current node.
         2. Compute the total horizontal width occupied by all branch subtrees,
            including horizontal spacing between siblings.
         3. Determine the starting x-coordinate so the branches are centered
@@ -435,136 +584,187 @@ class TreeVisualizer:
            - Compute the branch node's x-position using its subtree width.
            - Compute the branch node's y-position using the parent's height,
              vertical spacing, and the branch node's own height.
-           - Recursively assign positions to the branch subtree.
-        5. Continue recursively until all leaf nodes have positions.
+           - Push the branch node and its position onto the stack.
+        5. Continue until all leaf nodes have positions.
 
         Args:
-            measured_tree (dict): A tree produced by _measure_tree containing
-                '_measured' layout data for every node.
-            position (Position): The (x, y) position of the current node's
+            measured_tree (MeasuredNode): The root of a tree produced by
+                _measure_tree.
+            position (Position): The (x, y) position of the root node's
                 center in screen coordinates.
         """
-        measured_tree["_measured"]["position"] = (position.x, position.y)
-        branches = measured_tree.get("branches", [])
+        params = self.layout_params
 
-        if not branches:
-            return
+        stack = [(measured_tree, position)]
 
-        if measured_tree["_measured"]["leaves_only"]:
-            x_parent, y_parent = measured_tree["_measured"]["position"]
-            parent_height = measured_tree["_measured"]["height"]
-            parent_bottom = y_parent + parent_height // 2
+        while stack:
+            node, position = stack.pop()
+            node.position = position
+            branches = node.branches
 
-            y_cursor = parent_bottom + self.vertical_spacing
+            if not branches:
+                continue
 
-            for child in branches:
-                child_height = child["_measured"]["height"]
-                child_center_y = y_cursor + child_height // 2
-                child_center_x = x_parent
+            if node.leaves_only:
+                x_parent, y_parent = position
+                parent_bottom = y_parent + node.height // 2
 
-                self._assign_positions(child, Position(child_center_x, child_center_y))
+                y_cursor = parent_bottom + params.vertical_spacing
 
-                y_cursor = child_center_y + child_height // 2 + self.vertical_spacing
-        else:
-            total_width = sum(
-                branch_node["_measured"]["subtree_width"] for branch_node in branches
-            ) + self.horizontal_spacing * (len(branches) - 1)
+                for child in branches:
+                    child_height = child.height
+                    child_center_y = y_cursor + child_height // 2
+                    child_center_x = x_parent
 
-            x_start = position.x - total_width // 2
-            current_x = x_start
+                    stack.append((child, Position(child_center_x, child_center_y)))
 
-            for branch_node in branches:
-                branch_node_w = branch_node["_measured"]["subtree_width"]
-                branch_node_x = current_x + branch_node_w // 2
+                    y_cursor = (
+                        child_center_y + child_height // 2 + params.vertical_spacing
+                    )
+            else:
+                total_width = sum(
+                    branch_node.subtree_width for branch_node in branches
+                ) + params.horizontal_spacing * (len(branches) - 1)
 
-                branch_node_y = (
-                    position.y
-                    + measured_tree["_measured"]["height"] // 2
-                    + self.vertical_spacing
-                    + branch_node["_measured"]["height"] // 2
-                )
+                x_start = position.x - total_width // 2
+                current_x = x_start
 
-                self._assign_positions(
-                    branch_node, Position(branch_node_x, branch_node_y)
-                )
-                current_x += branch_node_w + self.horizontal_spacing
+                for branch_node in branches:
+                    branch_node_w = branch_node.subtree_width
+                    branch_node_x = current_x + branch_node_w // 2
+
+                    branch_node_y = (
+                        position.y
+                        + node.height // 2
+                        + params.vertical_spacing
+                        + branch_node.height // 2
+                    )
 
-    def _draw_node(self, node_data: dict, node_color: list[int]) -> None:
+                    stack.append((branch_node, Position(branch_node_x, branch_node_y)))
+                    current_x += branch_node_w + params.horizontal_spacing
+
+    def _node_template(
+        self, width: int, height: int, top_height: int, node_color: Color
+    ) -> pg.Surface:
         """
-        Render a single node using its precomputed layout data.
+        Return a pre-painted node background of the given size and color.
+
+        The template contains the filled top and bottom sections and the
+        border, so drawing a node's background is a single blit. Templates
+        are cached per (width, height, top_height, node_color); nodes of the
+        same size and level share one. The cache is cleared whenever the zoom
+        dependent state (and with it the border thickness) changes.
+
+        Args:
+            width (int): Node width in pixels.
+            height (int): Node height in pixels.
+            top_height (int): Height of the top (title) section in pixels.
+            node_color (Color): Color of the top section and border.
+
+        Returns:
+            pg.Surface: The node template surface.
+        """
+        key = (width, height, top_height, node_color)
+        template = self._node_templates.get(key)
+
+        if template is not None:
+            return template
+
+        # Filling the whole surface with the node color paints the top section
+        # and the border; the inside of the bottom section is then filled
+        # with the background color. Solid fills are cheaper than draw calls.
+        border = self.layout_params.border_thickness
+        bottom_top = max(top_height, border)
+        bottom_inside = pg.Rect(
+            border, bottom_top, width - border * 2, height - bottom_top - border
+        )
+
+        template = pg.Surface((width, height)).convert()
+        template.fill(node_color)
+        template.fill(self.background_color, bottom_inside)
 
-        This method draws a node rectangle split into a top and bottom
-        section, along with a border and text content. All positional and
-        dimensional information is read from the node's '_measured' data,
-        which must already be populated by the measurement and positioning
-        phases.
+        self._node_templates[key] = template
 
-        The drawing process follows these steps:
+        return template
+
+    def _prebake_node(
+        self, measured_node: MeasuredNode, node_color: Color
+    ) -> tuple[pg.Rect, pg.Surface, list[tuple[pg.Surface, tuple[int, int]]]]:
+        """
+        Precompute the geometry and text surfaces needed to draw a node.
+
+        This method computes everything that is constant between frames for a
+        single measured node, which must already be populated by the
+        measurement and positioning phases. Coordinates are
+        computed without scroll offset; the offset is applied when drawing.
+
+        The process follows these steps:
 
         1. Read the node's center position, width, and height.
         2. Construct a main rectangle centered at the given position.
-        3. Split the rectangle vertically into top and bottom sections.
-        4. Fill each section with its respective background color.
-        5. Draw a border around the full node rectangle.
-        6. Render and blit the title text into the top section.
-        7. Render and blit the subtitle text into the bottom section.
-
-        This method does not perform any layout calculations and assumes
-        that all geometry has been finalized beforehand.
+        3. Split the rectangle vertically into top and bottom sections, and
+           get the matching pre-painted node template (see _node_template).
+        4. Render the title lines for the top section and the subtitle lines
+           for the bottom section, as split during measurement, and compute
+           the top-left position of every line so that it is horizontally
+           centered in the node.
 
         Args:
-            node_data (dict): A measured node containing '_measured' layout
-                data and text fields to render.
+            measured_node (MeasuredNode): A measured and positioned node.
+            node_color (Color): Color of the node's top section and border.
+
+        Returns:
+            tuple: The main rectangle, the node template, and a list of
+                (surface, position) pairs for all text lines.
         """
-        x, y = node_data["_measured"]["position"]
-        x += self.scroll_x
-        y += self.scroll_y
+        params = self.layout_params
 
-        width = node_data["_measured"]["width"]
-        height = node_data["_measured"]["height"]
+        x, y = measured_node.position
+
+        width = measured_node.width
+        height = measured_node.height
 
         rect = pg.Rect(x - width // 2, y - height // 2, width, height)
-        top_height = node_data["_measured"]["top_height"]
-        bottom_height = node_data["_measured"]["bottom_height"]
+        top_height = measured_node.top_height
+        bottom_height = measured_node.bottom_height
         top_rect = pg.Rect(rect.left, rect.top, width, top_height)
         bottom_rect = pg.Rect(rect.left, rect.top + top_height, width, bottom_height)
-
-        pg.draw.rect(self.screen, node_color, top_rect)
-        pg.draw.rect(self.screen, self.background_color, bottom_rect)
-        pg.draw.rect(self.screen, node_color, rect, self.border_thickness)
-
-        title_lines = node_data["title"].split("\n")
-        subtitle_lines = node_data["subtitle"].split("\n")
+        template = self._node_template(width, height, top_height, node_color)
 
         top_surfs = [
-            self.font_top.render(line, True, self.background_color)
-            for line in title_lines
+            self._render_line(line, self.background_color)
+            for line in measured_node.title_lines
         ]
 
         bottom_surfs = [
-            self.font_bottom.render(line, True, self.text_color)
-            for line in subtitle_lines
+            self._render_line(line, self.text_color)
+            for line in measured_node.subtitle_lines
         ]
 
-        current_y = top_rect.top + self.node_margin_y
+        text_blits = []
+
+        current_y = top_rect.top + params.margin_y
         for surf in top_surfs:
             text_rect = surf.get_rect(center=(x, current_y + surf.get_height() // 2))
-            self.screen.blit(surf, text_rect)
+            text_blits.append((surf, text_rect.topleft))
             current_y += surf.get_height()
 
-        current_y = bottom_rect.top + self.node_margin_y
+        current_y = bottom_rect.top + params.margin_y
         for surf in bottom_surfs:
             text_rect = surf.get_rect(center=(x, current_y + surf.get_height() // 2))
-            self.screen.blit(surf, text_rect)
+            text_blits.append((surf, text_rect.topleft))
             current_y += surf.get_height()
 
-    def _draw_connectors(self, measured_tree: dict, node_color: list[int]) -> None:
+        return rect, template, text_blits
+
+    def _prebake_connectors(
+        self, measured_node: MeasuredNode
+    ) -> list[tuple[float, float]]:
         """
-        Draw orthogonal connector lines between a node and its branches.
+        Precompute the orthogonal connector path between a node and its branches.
 
-        This method renders tree connectors using only horizontal and vertical
-        line segments. For a node with one or more branches, the connectors are
-        drawn in three steps:
+        Tree connectors consist only of horizontal and vertical line segments.
+        For a node with one or more branches, the connectors are made up of:
 
         1. A vertical line extending downward from the bottom center of the
         parent node.
@@ -575,101 +775,251 @@ class TreeVisualizer:
         This layout ensures visually clean 90-degree connections and clearly
         communicates hierarchical relationships without diagonal lines.
 
+        All segments are joined into a single open polyline, so the connectors
+        of a node are drawn with one pg.draw.lines call. The path runs down the
+        parent stem, then along the junction from left to right, and goes down
+        to every branch node and back up to the junction on the way (branches
+        are positioned from left to right).
+
         The method assumes that all branch nodes have already been measured
-        and assigned absolute positions. It performs no layout calculations
-        and relies entirely on '_measured' metadata.
+        and assigned absolute positions. Coordinates are computed without
+        scroll offset.
 
         Args:
-            measured_tree (dict): A measured tree node containing position and
-                dimension data for the parent and all direct branches.
+            measured_node (MeasuredNode): A measured and positioned node, whose
+                direct branches are measured and positioned as well.
+
+        Returns:
+            list: The points of the connector path, or an empty list if the
+                node has no connectors.
         """
-        branches = measured_tree.get("branches", [])
+        branches = measured_node.branches
 
         if not branches:
-            return
+            return []
 
-        if measured_tree["_measured"]["leaves_only"]:
-            return
+        if measured_node.leaves_only:
+            return []
 
-        height = measured_tree["_measured"]["height"]
-        x, y = measured_tree["_measured"]["position"]
-        x += self.scroll_x
-        y += self.scroll_y
+        height = measured_node.height
+        x, y = measured_node.position
 
         parent_x = x
         parent_y = y + height // 2
 
         child_points = []
         for branch in branches:
-            bx, by = branch["_measured"]["position"]
-            bh = branch["_measured"]["height"]
-            child_points.append((bx + self.scroll_x, by + self.scroll_y - bh // 2))
-
-        junction_y = parent_y + self.vertical_spacing // 2
-
-        pg.draw.line(
-            self.screen,
-            node_color,
-            (parent_x, parent_y),
-            (parent_x, junction_y),
-            self.border_thickness,
-        )
+            bx, by = branch.position
+            bh = branch.height
+            child_points.append((bx, by - bh // 2))
 
-        min_x = min(x for x, _ in child_points)
-        max_x = max(x for x, _ in child_points)
+        junction_y = parent_y + self.layout_params.vertical_spacing // 2
 
-        pg.draw.line(
-            self.screen,
-            node_color,
-            (min_x, junction_y),
-            (max_x, junction_y),
-            self.border_thickness,
-        )
+        path = [(parent_x, parent_y), (parent_x, junction_y)]
 
         for cx, cy in child_points:
-            pg.draw.line(
-                self.screen,
-                node_color,
-                (cx, junction_y),
-                (cx, cy),
-                self.border_thickness,
-            )
+            path.extend([(cx, junction_y), (cx, cy), (cx, junction_y)])
+
+        return path
 
-    def _draw_tree(self, measured_tree: dict, level: int = 0) -> None:
+    def _prebake_tree(self, measured_tree: MeasuredNode) -> None:
         """
-        Recursively draw all nodes and connectors in a measured tree.
+        Precompute the draw data of all nodes in a measured tree.
 
         This method performs a depth-first traversal of a fully measured and
-        positioned tree structure. For each node, it renders both the visual
-        node representation and the orthogonal connector lines to its branches.
+        positioned tree structure, and appends a PrebakedNode for every node to
+        self.render_list, in drawing order. Each entry holds the node color,
+        the node rectangle and template, the rendered text lines with their
+        positions, the connector path to the node's branches, and the bounding
+        rectangle of everything drawn for the node.
+
+        Doing this once per layout means the render loop does not split
+        strings, render text, or compute geometry; it only issues draw calls.
+
+        Args:
+            measured_tree (MeasuredNode): The root of a measured and positioned
+                tree.
+        """
+        border = self.layout_params.border_thickness
+
+        for node, level in measured_tree.walk():
+            node_color = self.level_node_colors[level]
+            rect, template, text_blits = self._prebake_node(node, node_color)
+            connector_path = self._prebake_connectors(node)
+
+            bounds = rect.copy()
+            if connector_path:
+                xs = [x for x, _ in connector_path]
+                ys = [y for _, y in connector_path]
+                bounds.union_ip(
+                    pg.Rect(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys))
+                )
+            bounds.inflate_ip(border * 2, border * 2)
+
+            self.render_list.append(
+                PrebakedNode(
+                    color=node_color,
+                    rect=rect,
+                    bounds=bounds,
+                    template=template,
+                    text_blits=text_blits,
+                    connector_path=connector_path,
+                )
+            )
+
+    def _node_blits(
+        self, node: PrebakedNode, offset: tuple[int, int]
+    ) -> list[tuple[pg.Surface, tuple]]:
+        """
+        List the blits that draw a single node from its prebaked draw data.
+
+        These are the node's pre-painted template, which contains the filled
+        top and bottom sections and the border, followed by the prebaked text
+        lines, all shifted by the given offset. No layout or
+        text rendering is performed.
 
-        The drawing order is:
+        Args:
+            node (PrebakedNode): Prebaked draw data produced by _prebake_tree.
+            offset (tuple[int, int]): Offset added to all positions.
+
+        Returns:
+            list[tuple[pg.Surface, tuple]]: (surface, position) pairs in
+                drawing order, as accepted by Surface.blits.
+        """
+        dx, dy = offset
+        blits = [(node.template, (node.rect.x + dx, node.rect.y + dy))]
 
-        1. Draw the current node rectangle and text.
-        2. Draw connector lines from the node to its direct branches.
-        3. Recursively draw each branch subtree.
+        for surf, (x, y) in node.text_blits:
+            blits.append((surf, (x + dx, y + dy)))
 
-        This method assumes that all nodes already have their final width,
-        height, subtree dimensions, and absolute screen positions assigned.
-        It contains no layout or measurement logic and relies entirely on
-        the '_measured' metadata.
+        return blits
+
+    def _draw_connectors(
+        self, surface: pg.Surface, node: PrebakedNode, offset: tuple[int, int]
+    ) -> None:
+        """
+        Draw the prebaked connector path between a node and its branches.
 
         Args:
-            measured_tree (dict): A measured tree structure containing layout
-                and position metadata for every node.
-            level (int): Depth level in the tree (0=root).
+            surface (pg.Surface): Surface to draw onto.
+            node (PrebakedNode): Prebaked draw data produced by _prebake_tree.
+            offset (tuple[int, int]): Offset added to all positions.
         """
-        if level == self.max_depth:
-            node_color = self.leaf_background_color
-        else:
-            color_idx = min(level, len(self.color_levels) - 1)
-            node_color = self.color_levels[color_idx]
+        dx, dy = offset
+
+        if not node.connector_path:
+            return
+
+        pg.draw.lines(
+            surface,
+            node.color,
+            False,
+            [(x + dx, y + dy) for x, y in node.connector_path],
+            self.layout_params.border_thickness,
+        )
+
+    def _draw_tree(self, surface: pg.Surface, offset: tuple[int, int]) -> None:
+        """
+        Draw all nodes and connectors of the prebaked tree.
+
+        For each entry in self.render_list, the node is drawn first and then
+        the connector lines to its branches. The list is in depth-first order,
+        so branch nodes are drawn on top of the connectors leading to them.
+
+        Nodes whose bounds, including their connectors, lie entirely outside
+        the surface are skipped. Node blits are collected and issued with a
+        single Surface.blits call for every run of nodes without connectors,
+        i.e. until a node's connectors have to be drawn on top of the nodes
+        before them.
+
+        Args:
+            surface (pg.Surface): Surface to draw onto.
+            offset (tuple[int, int]): Offset added to all positions, such as
+                the scroll offset.
+        """
+        # Bound methods are looked up once instead of once per node.
+        in_view = surface.get_rect().move(-offset[0], -offset[1]).colliderect
+        node_blits = self._node_blits
+        draw_connectors = self._draw_connectors
+        blits = surface.blits
+
+        pending_blits: list[tuple[pg.Surface, tuple]] = []
+
+        for node in self.render_list:
+            if not in_view(node.bounds):
+                continue
 
-        self._draw_node(measured_tree, node_color)
-        self._draw_connectors(measured_tree, node_color)
+            pending_blits.extend(node_blits(node, offset))
 
-        for branch_node in measured_tree.get("branches", []):
-            self._draw_tree(branch_node, level=level + 1)
+            if node.connector_path:
+                blits(pending_blits, doreturn=False)
+                pending_blits = []
+                draw_connectors(surface, node, offset)
+
+        blits(pending_blits, doreturn=False)
+
+    def _invalidate_scene(self) -> None:
+        """Mark the shown view as outdated after a scroll or layout change."""
+        self._scene_valid = False
+
+    def _render_tree_canvas(self) -> None:
+        """
+        Draw the complete tree once into an off-screen canvas.
+
+        The canvas covers the bounding box of all nodes, so further scrolling
+        only changes where it is blitted and does not redraw the tree. If the
+        canvas would exceed TREE_CANVAS_MAX_PIXELS (e.g. at high zoom levels),
+        no canvas is built and the visible nodes keep being drawn from the
+        prebaked tree instead.
+        """
+        if not self.render_list:
+            self._tree_canvas_too_large = True
+            return
+
+        bounds = self.render_list[0].rect.unionall(
+            [node.rect for node in self.render_list[1:]]
+        )
+        border = self.layout_params.border_thickness
+        bounds.inflate_ip(border * 2, border * 2)
+
+        if bounds.width * bounds.height > TREE_CANVAS_MAX_PIXELS:
+            self._tree_canvas_too_large = True
+            return
+
+        canvas = pg.Surface(bounds.size)
+        canvas.fill(self.background_color)
+        self._draw_tree(canvas, (-bounds.x, -bounds.y))
+
+        self._tree_canvas = canvas
+        self._tree_canvas_origin = bounds.topleft
+
+    def _render_scene(self) -> None:
+        """
+        Compose the current view of the tree onto the screen.
+
+        After a layout change, only the visible nodes are drawn straight to
+        the screen, so zooming does not pay for drawing the whole tree. Once
+        the view is scrolled, the whole tree is drawn into the tree canvas
+        (see _render_tree_canvas), which is then blitted to the screen at the
+        scroll offset. If the tree is too large for a canvas, the visible
+        nodes keep being drawn at the scroll offset.
+        """
+        if (
+            self._scrolled_since_layout
+            and self._tree_canvas is None
+            and not self._tree_canvas_too_large
+        ):
+            self._render_tree_canvas()
+
+        if self._tree_canvas is not None:
+            x, y = self._tree_canvas_origin
+            self.screen.fill(self.background_color)
+            self.screen.blit(self._tree_canvas, (x + self.scroll_x, y + self.scroll_y))
+        else:
+            self.screen.fill(self.background_color)
+            self._draw_tree(self.screen, (self.scroll_x, self.scroll_y))
+
+        self._scene_valid = True
 
     def draw(self) -> None:
         """
@@ -680,20 +1030,34 @@ class TreeVisualizer:
 
         1. Measure the entire tree to determine node and subtree sizes.
         2. Assign screen positions to all nodes based on measured sizes.
-        3. Enter the main render loop:
-            - Handle window and quit events.
-            - Clear the screen using the background color.
-            - Draw the entire tree using precomputed layout data.
-            - Update the display.
-
-        The measurement and positioning phases are executed once, while
-        drawing is repeated every frame.
+        3. Prebake the draw data (rectangles, text surfaces, connectors).
+        4. If enabled in the runtime configuration, export the measured tree
+           to JSON.
+        5. Enter the main render loop:
+            - Handle window and quit events. If the last frame is still up to
+              date, block until the next event instead of polling.
+            - If the view changed, compose it onto the screen from the tree
+              canvas or the prebaked draw data (see _render_scene).
+            - If the view changed or the window was exposed, update the
+              display.
+
+        The measurement, positioning, and prebaking phases are executed once
+        per layout, and the view is only redrawn after scrolling or zooming.
         """
         self._update_tree_layout()
-        export_dict_to_json(data=self.measured_tree, path=self.data_export_file_path)
+
+        if self.export_measured_tree:
+            export_dict_to_json(
+                data=self.measured_tree.to_dict(), path=self.data_export_file_path
+            )
 
         while True:
-            self._handle_events()
-            self.screen.fill(self.background_color)
-            self._draw_tree(self.measured_tree)
-            pg.display.flip()
+            self._handle_events(wait=self._scene_valid and not self._dirty)
+
+            if not self._scene_valid:
+                self._render_scene()
+                self._dirty = True
+
+            if self._dirty:
+                pg.display.flip()
+                self._dirty = False
@@ -1,15 +1,44 @@
 """Module for general utility functions."""
 
-import re
 import json
 from pathlib import Path
+from collections.abc import Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Marks list entries on the _iter_json stack, which have no key to write.
+_LIST_ITEM = object()
+
+
+def load_json(path: Path) -> dict:
+    """
+    Load a JSON file from disk. Uses orjson when it is installed, which parses
+    straight from bytes and is considerably faster on large trees, and falls
+    back to the standard library json module otherwise.
+
+    Args:
+        path (Path): Path to the '.json' file to load.
+
+    Returns:
+        dict: The deserialized JSON content.
+    """
+    content = path.read_bytes()
+
+    if orjson is not None:
+        return orjson.loads(content)
+
+    return json.loads(content)
 
 
 def export_dict_to_json(data: dict, path: Path, indent: int = 2) -> None:
     """
     Export a dictionary to a JSON file. The function serializes the provided
-    dictionary and writes it to disk using UTF-8 encoding. Existing files will
-    be overwritten.
+    dictionary and streams it to disk using UTF-8 encoding (see _iter_json),
+    without building the complete JSON string first. Existing files will be
+    overwritten.
 
     Notes:
         - Lists containing only simple values (numbers, strings) are kept on
@@ -22,12 +51,93 @@ def export_dict_to_json(data: dict, path: Path, indent: int = 2) -> None:
         path (Path): Destination file path ending in '.json'.
         indent (int): Number of spaces to use for pretty-printing.
     """
-    json_str = json.dumps(data, indent=indent, ensure_ascii=False)
-    json_str = re.sub(
-        r"\[\s*([^\[\]\{\}]+?)\s*\]",
-        lambda m: "[" + ", ".join(s.strip() for s in m.group(1).split(",")) + "]",
-        json_str,
-    )
-
     with path.open("w", encoding="utf-8") as file:
-        file.write(json_str)
+        file.writelines(_iter_json(data, indent))
+
+
+def _iter_json(data: object, indent: int) -> Iterator[str]:
+    """
+    Serialize a value to pretty-printed JSON, chunk by chunk.
+
+    Dictionaries and lists that contain dictionaries or lists are spread over
+    multiple lines, indented like json.dumps does. Lists of simple values are
+    written on a single line. Scalars are encoded by json.dumps, and keys are
+    converted to strings the same way json.dumps converts them. Containers
+    are tracked on an explicit stack, so deeply nested trees do not run into
+    the interpreter's recursion limit.
+
+    Args:
+        data (object): The JSON-serializable value to encode.
+        indent (int): Number of spaces to use for pretty-printing.
+
+    Yields:
+        str: Consecutive pieces of the JSON document.
+
+    Raises:
+        TypeError: If a dictionary key is not a str, int, float, bool or None.
+    """
+    stack: list[tuple[Iterator, str]] = []
+    value = data
+
+    while True:
+        if isinstance(value, dict) and value:
+            yield "{"
+            stack.append((enumerate(value.items()), "}"))
+        elif isinstance(value, (list, tuple)) and any(
+            isinstance(item, (dict, list, tuple)) for item in value
+        ):
+            yield "["
+            stack.append((enumerate((_LIST_ITEM, item) for item in value), "]"))
+        elif isinstance(value, (list, tuple)):
+            items = ", ".join(json.dumps(item, ensure_ascii=False) for item in value)
+            yield "[" + items + "]"
+        else:
+            yield json.dumps(value, ensure_ascii=False)
+
+        # Move on to the next value, closing all containers that are done.
+        while stack:
+            entries, closing = stack[-1]
+            entry = next(entries, None)
+
+            if entry is None:
+                stack.pop()
+                yield "\n" + " " * (indent * len(stack)) + closing
+                continue
+
+            index, (key, value) = entry
+            yield ("," if index else "") + "\n" + " " * (indent * len(stack))
+
+            if key is not _LIST_ITEM:
+                yield json.dumps(_json_key(key), ensure_ascii=False) + ": "
+
+            break
+        else:
+            return
+
+
+def _json_key(key: object) -> str:
+    """
+    Convert a dictionary key to a string, following the rules of json.dumps.
+
+    Strings are kept as they are, while int, float, bool and None keys become
+    their JSON representation (for example 1 becomes '1' and None becomes
+    'null').
+
+    Args:
+        key (object): The dictionary key to convert.
+
+    Returns:
+        str: The key as a string.
+
+    Raises:
+        TypeError: If the key is not a str, int, float, bool or None.
+    """
+    if isinstance(key, str):
+        return key
+
+    if key is None or isinstance(key, (int, float)):
+        return json.dumps(key)
+
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+    )